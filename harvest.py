@@ -1,6 +1,6 @@
 import argparse
-import json
 import logging
+import orjson
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -48,8 +48,8 @@ def load_output_schema(schema_path: Path) -> dict:
         )
         return {}
     try:
-        with open(schema_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(schema_path, "rb") as f:
+            return orjson.loads(f.read())
     except Exception as e:
         logger.error(f"Failed to load output schema: {e}")
         return {}
@@ -105,6 +105,15 @@ if __name__ == "__main__":
         action="store_true",
         help="Bypass the marker-pdf OCR engine and skip image-only PDFs",
     )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "Skip source files whose output JSON is newer than the source and its tracked inputs "
+            "(schema, agency CSV, TX agencies.html/retentioncodes.csv, NC structure JSON); "
+            "re-run without it after parser or config changes"
+        ),
+    )
     parser.add_argument(
         "--update-dl",
         action="store_true",
@@ -9,6 +9,13 @@ from processing.central_file import make_record, clean_record_fields
 
 logger = logging.getLogger(__name__)
 
+_LONG_DATE_RE = re.compile(r'([A-Z][a-z]+\s+\d{1,2},\s+\d{4})')
+_BIB_TITLE_RE = re.compile(r'\(Bibliographic Title:\s*([^)]+)\)')
+_BIB_TITLE_STRIP_RE = re.compile(r'\**\(Bibliographic Title:[^)]+\)\**')
+_SERIES_TITLE_RE = re.compile(r'^(?:- )?\*\*([^*.]+?)\.?\*\*\.?\s*(.*)')
+_SUB_ITEM_RE = re.compile(r'^([a-z\d]\.)\s*(.*)')
+_YEARS_RE = re.compile(r'(\d+)\s*years?')
+
 class AlabamaNarrativeExtractor:
     # Standardized Trigger Codes
     # AC: After Closed
@@ -73,7 +80,7 @@ class AlabamaNarrativeExtractor:
             if found_header and line_strip:
                 # Try to parse date
                 # Formats: "October 21, 2015" or "April 26, 2002"
-                date_match = re.search(r'([A-Z][a-z]+\s+\d{1,2},\s+\d{4})', line_strip)
+                date_match = _LONG_DATE_RE.search(line_strip)
                 if date_match:
                     try:
                         dt = datetime.strptime(date_match.group(1), '%B %d, %Y')
@@ -98,10 +105,10 @@ class AlabamaNarrativeExtractor:
             found_any_record = True
             desc_text = " ".join(current_desc).strip()
             
-            bib_match = re.search(r'\(Bibliographic Title:\s*([^)]+)\)', desc_text)
+            bib_match = _BIB_TITLE_RE.search(desc_text)
             bib_title = bib_match.group(1).strip() if bib_match else None
             
-            clean_desc = re.sub(r'\**\(Bibliographic Title:[^)]+\)\**', '', desc_text).strip()
+            clean_desc = _BIB_TITLE_STRIP_RE.sub('', desc_text).strip()
             
             citation = None
             if self.config.legal_citation_pattern:
@@ -142,7 +149,7 @@ class AlabamaNarrativeExtractor:
                 continue
 
             # Detect Series Title (support optional trailing period)
-            title_match = re.match(r'^(?:- )?\*\*([^*.]+?)\.?\*\*\.?\s*(.*)', line_strip)
+            title_match = _SERIES_TITLE_RE.match(line_strip)
             if title_match:
                 save_current()
                 current_title = title_match.group(1).strip()
@@ -209,7 +216,7 @@ class AlabamaNarrativeExtractor:
                 current_title = parent_title
                 continue
 
-            sub_item_match = re.match(r'^([a-z\d]\.)\s*(.*)', line_strip)
+            sub_item_match = _SUB_ITEM_RE.match(line_strip)
             if sub_item_match:
                 save_req()
                 sub_title = sub_item_match.group(2).strip()
@@ -237,7 +244,7 @@ class AlabamaNarrativeExtractor:
         if "superseded" in text_lower:
             return "US", None
 
-        year_match = re.search(r'(\d+)\s*years?', text_lower)
+        year_match = _YEARS_RE.search(text_lower)
         duration = int(year_match.group(1)) if year_match else None
         
         if "after" in text_lower:
@@ -253,6 +260,7 @@ class AlabamaNarrativeExtractor:
 
     def _finalize_records(self, schedule_id: str) -> List[Dict[str, Any]]:
         processed = []
+        today = date.today().isoformat()
         for title, data in self.records.items():
             if 'trigger' not in data: continue 
             
@@ -270,7 +278,7 @@ class AlabamaNarrativeExtractor:
                 legal_citation=data.get('citation', ''),
                 agency_name=self.agency_name,
                 last_updated=self.effective_date,
-                last_checked=str(date.today())
+                last_checked=today
             )
             processed.append(clean_record_fields(raw_record, self.config))
         return processed
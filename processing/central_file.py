@@ -1,11 +1,10 @@
-import json
 import re
 import logging
 from pathlib import Path
 from datetime import date
 from collections import defaultdict
 from word2number import w2n
-from copy import deepcopy
+import orjson
 from processing.base_config import StateScheduleConfig
 
 logger = logging.getLogger(__name__)
@@ -71,9 +70,17 @@ def set_nested_val(record: dict, flat_key: str, value):
 # Record Life Cycle
 # ---------------------------------------------------------------------------
 
+def _copy_schema(node):
+    """Copies a JSON-shaped template (dicts, lists, scalars) without deepcopy's memo bookkeeping."""
+    if isinstance(node, dict):
+        return {key: _copy_schema(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_schema(value) for value in node]
+    return node
+
 def make_record(schema: dict, **overrides) -> dict:
     """Creates a nested record, mapping flat overrides to the new structure."""
-    record = deepcopy(schema) if schema else {}
+    record = _copy_schema(schema) if schema else {}
     for key, value in overrides.items():
         set_nested_val(record, key, value)
     return record
@@ -105,6 +112,26 @@ TRIGGER_MAP = {
     'US': [r'superseded', r'obsolete', r'rescinded'],
 }
 
+# Compiled once at import; dict order is preserved so the first matching code still wins
+_TRIGGER_CODE_RES = [(code, re.compile(rf'\b{code}\b')) for code in TRIGGER_MAP]
+_TRIGGER_PATTERN_RES = [
+    (code, [re.compile(pattern) for pattern in patterns])
+    for code, patterns in TRIGGER_MAP.items()
+]
+
+_PERMANEN_TYPO_RE = re.compile(r'(?i)\bPermanen\b')
+_DISPOSITION_TAIL_RE = re.compile(
+    r'(?i)(Non-confidential Destruction|Confidential Destruction|Permanent, Archives|Permanent, In Agency|Archives|Destruction)$'
+)
+_YEARS_RE = re.compile(r'(\d+)\s*years?', re.IGNORECASE)
+_MONTHS_RE = re.compile(r'(\d+)\s*months?', re.IGNORECASE)
+_TRIGGER_BOILERPLATE_RE = re.compile(
+    r'(?i)\b(Retain|then|destroy|transfer|to|the|State Records Center|on-site|in compliance with No\. \d+ on cover sheet|Total retention period)\b'
+)
+_TRIGGER_CONNECTIVES_RE = re.compile(r'\b(plus|after|for|until)\b', re.IGNORECASE)
+_TRIGGER_TAIL_RE = re.compile(r'(?i)\b(THEN|plus)\s+.*$')
+_EDGE_PUNCT_RE = re.compile(r'^[,\.;\s:]+|[,\.;\s:]+$')
+
 def standardize_trigger(retention_text: str) -> str | None:
     """Maps raw retention text to a standardized TX-style code."""
     if not retention_text:
@@ -113,42 +140,46 @@ def standardize_trigger(retention_text: str) -> str | None:
     text_lower = retention_text.lower()
     
     # Check for direct code matches (case-sensitive for codes)
-    for code in TRIGGER_MAP.keys():
-        if re.search(rf'\b{code}\b', retention_text):
+    for code, code_re in _TRIGGER_CODE_RES:
+        if code_re.search(retention_text):
             return code
 
     # Check for pattern matches
-    for code, patterns in TRIGGER_MAP.items():
+    for code, patterns in _TRIGGER_PATTERN_RES:
         for pattern in patterns:
-            if re.search(pattern, text_lower):
+            if pattern.search(text_lower):
                 return code
                 
     return None
 
 def clean_record_fields(record: dict, config: StateScheduleConfig) -> dict:
     """Universal cleaning logic for nested records."""
-    title = re.sub(r'\s+', ' ', str(get_nested_val(record, 'series_title') or '')).strip()
-    desc = re.sub(r'\s+', ' ', str(get_nested_val(record, 'series_description') or '')).strip()
-    retention = re.sub(r'\s+', ' ', str(get_nested_val(record, 'retention_statement') or '')).strip()
-    disposition = re.sub(r'\s+', ' ', str(get_nested_val(record, 'disposition') or '')).strip()
+    title = ' '.join(str(get_nested_val(record, 'series_title') or '').split())
+    desc = ' '.join(str(get_nested_val(record, 'series_description') or '').split())
+    retention = ' '.join(str(get_nested_val(record, 'retention_statement') or '').split())
+    disposition = ' '.join(str(get_nested_val(record, 'disposition') or '').split())
 
     # Common typos
-    retention = re.sub(r'(?i)\bPermanen\b', 'Permanent', retention)
-    disposition = re.sub(r'(?i)\bPermanen\b', 'Permanent', disposition)
+    retention = _PERMANEN_TYPO_RE.sub('Permanent', retention)
+    disposition = _PERMANEN_TYPO_RE.sub('Permanent', disposition)
 
     # Simple disposition extraction
-    disp_match = re.search(
-        r'(?i)(Non-confidential Destruction|Confidential Destruction|Permanent, Archives|Permanent, In Agency|Archives|Destruction)$',
-        disposition if disposition else retention
-    )
-    if disp_match and not disposition:
-        disposition = disp_match.group(1).title()
-        retention = retention[:disp_match.start()].strip()
+    # Only used when the disposition column is empty, and every alternative ends in
+    # 'destruction' or 'archives', so most records never reach the regex.
+    if not disposition and retention[-11:].lower().endswith(('destruction', 'archives')):
+        disp_match = _DISPOSITION_TAIL_RE.search(retention)
+        if disp_match:
+            disposition = disp_match.group(1).title()
+            retention = retention[:disp_match.start()].strip()
+
+    # retention/disposition are final from here on, so lowercase them once
+    retention_lower = retention.lower()
+    disp_lower = disposition.lower()
 
     # Confidential flag
     is_confidential = (
-        "confidential" in disposition.lower()
-        and "non-confidential" not in disposition.lower()
+        "confidential" in disp_lower
+        and "non-confidential" not in disp_lower
     )
 
     # Years calculation
@@ -159,8 +190,8 @@ def clean_record_fields(record: dict, config: StateScheduleConfig) -> dict:
     clean_trigger = retention
     
     # Check for '{N} years' or '{N} months'
-    years_match = re.search(r'(\d+)\s*years?', retention, re.IGNORECASE)
-    months_match = re.search(r'(\d+)\s*months?', retention, re.IGNORECASE)
+    years_match = _YEARS_RE.search(retention)
+    months_match = _MONTHS_RE.search(retention)
     
     if years_match:
         retention_years = int(years_match.group(1))
@@ -176,16 +207,16 @@ def clean_record_fields(record: dict, config: StateScheduleConfig) -> dict:
 
     # Clean up leftovers in trigger
     # Remove common boilerplate
-    clean_trigger = re.sub(r'(?i)\b(Retain|then|destroy|transfer|to|the|State Records Center|on-site|in compliance with No\. \d+ on cover sheet|Total retention period)\b', '', clean_trigger)
-    clean_trigger = re.sub(r'\b(plus|after|for|until)\b', '', clean_trigger, flags=re.IGNORECASE)
+    clean_trigger = _TRIGGER_BOILERPLATE_RE.sub('', clean_trigger)
+    clean_trigger = _TRIGGER_CONNECTIVES_RE.sub('', clean_trigger)
     
     # Remove everything after 'then' or 'plus' if they was meant to be the end
-    clean_trigger = re.sub(r'(?i)\b(THEN|plus)\s+.*$', '', clean_trigger)
+    clean_trigger = _TRIGGER_TAIL_RE.sub('', clean_trigger)
 
-    clean_trigger = re.sub(r'\s+', ' ', clean_trigger).strip()
-    clean_trigger = re.sub(r'^[,\.;\s:]+|[,\.;\s:]+$', '', clean_trigger) # Strip leading/trailing punctuation
+    clean_trigger = ' '.join(clean_trigger.split())
+    clean_trigger = _EDGE_PUNCT_RE.sub('', clean_trigger) # Strip leading/trailing punctuation
 
-    if 'permanent' in retention.lower() or 'permanent' in disposition.lower():
+    if 'permanent' in retention_lower or 'permanent' in disp_lower:
         retention_years = 999 
         # If it's permanent, the trigger is usually just 'Permanent'
         if not clean_trigger or clean_trigger.lower() == 'permanent':
@@ -211,7 +242,9 @@ def clean_record_fields(record: dict, config: StateScheduleConfig) -> dict:
     set_nested_val(record, 'retention_months', retention_months)
     set_nested_val(record, 'disposition', disposition)
     set_nested_val(record, 'confidential', is_confidential)
-    set_nested_val(record, 'last_checked', str(date.today()))
+    # Parsers stamp last_checked once per run; only fill it in for records that arrive without one
+    if not get_nested_val(record, 'last_checked'):
+        set_nested_val(record, 'last_checked', date.today().isoformat())
     set_nested_val(record, 'retention_code', retention_code or "")
 
     return record
@@ -247,8 +280,8 @@ def save_records(records: list[dict], output_dir: Path, group_by: str = None, de
 
     if not group_by:
         output_path = output_dir / default_filename
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(records, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
         return
 
     grouped = defaultdict(list)
@@ -259,5 +292,5 @@ def save_records(records: list[dict], output_dir: Path, group_by: str = None, de
     for key, group_records in grouped.items():
         safe_key = "".join([c for c in key if c.isalnum() or c in (' ', '.', '-', '_')]).strip()
         output_path = output_dir / f"{safe_key}.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(group_records, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(group_records, option=orjson.OPT_INDENT_2))
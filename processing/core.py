@@ -1,27 +1,39 @@
 import re
 import logging
-import pdfplumber
+import pymupdf
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+_EFFECTIVE_DATE_RE = re.compile(r'(?i)EFFECTIVE\s+(?:SCHEDULE\s+)?DATE[:\s]+(\d{1,2}/\d{1,2}/\d{4})')
+_HYPHEN_BREAK_RE = re.compile(r'-\s+')
+_DESCRIPTION_START_RE = re.compile(
+    r'((?:This series\s+)?(?:documents|Collects|Verifies|Consists|consists)\b.*)',
+    re.IGNORECASE
+)
+# Every match of _DESCRIPTION_START_RE contains one of these; most titles contain none
+_DESCRIPTION_KEYWORDS = ('documents', 'collects', 'verifies', 'consists')
+
 def analyze_pdf_preflight(pdf_path: Path) -> tuple[bool, str | None]:
     """Determines if a PDF is an image scan and extracts the effective date if possible."""
+    # MuPDF's plain-text pass is far cheaper than pdfplumber's layout analysis, and this
+    # check only needs to know whether text exists and where the date string is.
     is_image = True
     eff_date = None
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if not pdf.pages:
+        with pymupdf.open(pdf_path) as pdf:
+            if pdf.page_count == 0:
                 return is_image, eff_date
 
-            pages_to_check = min(2, len(pdf.pages))
+            pages_to_check = min(2, pdf.page_count)
             for i in range(pages_to_check):
-                text = pdf.pages[i].extract_text(x_tolerance=2, y_tolerance=2)
+                text = pdf[i].get_text()
                 if text and text.strip():
                     is_image = False 
                     if eff_date is None:
-                        match = re.search(r'(?i)EFFECTIVE\s+(?:SCHEDULE\s+)?DATE[:\s]+(\d{1,2}/\d{1,2}/\d{4})', text)
+                        match = _EFFECTIVE_DATE_RE.search(text)
                         if match:
                             eff_date = datetime.strptime(match.group(1), '%m/%d/%Y').strftime('%Y-%m-%d')
                     if eff_date:
@@ -31,22 +43,33 @@ def analyze_pdf_preflight(pdf_path: Path) -> tuple[bool, str | None]:
 
     return is_image, eff_date
 
+def iter_pages_closing(pdf):
+    """Yields pdfplumber pages, closing each one (dropping its cached chars/objects) once the caller moves on."""
+    for page in pdf.pages:
+        try:
+            yield page
+        finally:
+            page.close()
+
+def word_reading_order(w: dict) -> tuple[float, float]:
+    """Sort key for reading order: approximate line (top rounded to nearest 5), then left-to-right."""
+    return (round(w['top'] / 5) * 5, w['x0'])
+
 def stringify_words(word_list: list[dict]) -> str:
     """Converts a list of pdfplumber word dicts into a single cleaned string."""
     if not word_list:
         return ""
-    # Sort by approximate line (top rounded to nearest 5) and then left-to-right
-    word_list.sort(key=lambda w: (round(w['top'] / 5) * 5, w['x0']))
+    # Callers that pre-sort their pages make this a linear, already-ordered timsort pass
+    word_list.sort(key=word_reading_order)
     text = " ".join([w['text'] for w in word_list])
     # Clean up hyphenated line breaks
-    return re.sub(r'-\s+', '', text).strip()
+    return _HYPHEN_BREAK_RE.sub('', text).strip()
 
+@lru_cache(maxsize=8192)
 def split_title_and_description(raw_text: str) -> tuple[str, str]:
     """Splits a combined text block into a Title and a Description based on common triggers."""
-    match = re.search(
-        r'((?:This series\s+)?(?:documents|Collects|Verifies|Consists|consists)\b.*)',
-        raw_text, re.IGNORECASE
-    )
+    lowered = raw_text.lower()
+    match = _DESCRIPTION_START_RE.search(raw_text) if any(kw in lowered for kw in _DESCRIPTION_KEYWORDS) else None
     if match:
         return raw_text[:match.start()].strip(), match.group(1).strip()
     
@@ -1,11 +1,12 @@
-import gc
 import json
 import re
 import logging
 import multiprocessing
 import csv
+import contextlib
 from pathlib import Path
 from functools import partial
+import pdfplumber
 
 from processing.base_config import StateScheduleConfig
 from processing.core import analyze_pdf_preflight
@@ -19,18 +20,30 @@ from processing.central_file import save_records, score_records
 
 logger = logging.getLogger(__name__)
 
+_AGENCY_PREFIX_RE = re.compile(r'^(\d+)')
+
 # Global semaphore for GPU access (initialized in run_state_pipeline)
 _gpu_semaphore = None
+# Per-process bound worker (agency mapping, schema, config); set once by init_worker
+_worker = None
 
-def init_worker(semaphore):
-    """Initializes the worker process with a global semaphore."""
-    global _gpu_semaphore
+def init_worker(semaphore, worker=None):
+    """Initializes the worker process with a global semaphore and its bound worker function."""
+    global _gpu_semaphore, _worker
     _gpu_semaphore = semaphore
+    _worker = worker
+
+def _run_worker(file_path: Path):
+    """Pool task: only the path crosses the process boundary per task."""
+    return _worker(file_path)
+
+def _agency_csv_path(state_code: str) -> Path:
+    return Path(f"processing/{state_code}/resources/agencies.csv")
 
 def load_agency_mapping(state_code: str) -> dict[str, str]:
     """Loads state-specific agency mapping CSV if it exists."""
     mapping = {}
-    csv_path = Path(f"processing/{state_code}/resources/agencies.csv")
+    csv_path = _agency_csv_path(state_code)
     
     if not csv_path.exists():
         return mapping
@@ -51,7 +64,7 @@ def process_and_evaluate(pdf_path: Path, output_dir: Path, agency_mapping: dict,
     pdf_path = Path(pdf_path)
     schedule_id = pdf_path.stem
 
-    match = re.match(r'^(\d+)', schedule_id)
+    match = _AGENCY_PREFIX_RE.match(schedule_id)
     agency_code = match.group(1) if match else schedule_id[:3]
     agency_name = agency_mapping.get(agency_code, None)
 
@@ -80,46 +93,49 @@ def process_and_evaluate(pdf_path: Path, output_dir: Path, agency_mapping: dict,
         best_records = []
         winning_method = "None"
 
-        for strategy in strategies:
-            logger.info(f"[{schedule_id}] Attempting strategy: {strategy.upper()}")
-            records = []
-
-            if strategy == 'html':
-                records = parse_using_marker_html_optimized(
-                    pdf_path, schedule_id, effective_date, is_image, schema, config,
-                    gpu_semaphore=_gpu_semaphore
-                )
-            elif strategy == 'table':
-                records = parse_using_table_engine(
-                    pdf_path, schedule_id, effective_date, schema, config
-                )
-            elif strategy == 'silo':
-                records = parse_using_vertical_silo(
-                    pdf_path, schedule_id, effective_date, schema, config
-                )
-
-            from processing.central_file import set_nested_val
-            for record in records:
-                set_nested_val(record, 'agency_name', agency_name)
-                if source_url:
-                    set_nested_val(record, 'url', source_url)
-
-            score = score_records(records, config)
-
-            if score > best_score:
-                best_score = score
-                best_records = records
-                winning_method = strategy.upper()
-
-            if len(records) > 0 and score >= (len(records) * 10):
-                logger.info(
-                    f"[{schedule_id}] Early termination triggered: {strategy.upper()} "
-                    f"achieved a penalty-free extraction."
-                )
-                break
-
-            del records
-            gc.collect()
+        # The table and silo engines share one pdfplumber document, opened on first use,
+        # so a file that falls through both is only loaded once.
+        plumber_pdf = None
+
+        with contextlib.ExitStack() as pdf_stack:
+            for strategy in strategies:
+                logger.info(f"[{schedule_id}] Attempting strategy: {strategy.upper()}")
+                records = []
+
+                if strategy == 'html':
+                    records = parse_using_marker_html_optimized(
+                        pdf_path, schedule_id, effective_date, is_image, schema, config,
+                        gpu_semaphore=_gpu_semaphore
+                    )
+                elif strategy in ('table', 'silo'):
+                    if plumber_pdf is None:
+                        plumber_pdf = pdf_stack.enter_context(pdfplumber.open(pdf_path))
+                    parse = parse_using_table_engine if strategy == 'table' else parse_using_vertical_silo
+                    records = parse(
+                        pdf_path, schedule_id, effective_date, schema, config, pdf=plumber_pdf
+                    )
+
+                from processing.central_file import set_nested_val
+                for record in records:
+                    set_nested_val(record, 'agency_name', agency_name)
+                    if source_url:
+                        set_nested_val(record, 'url', source_url)
+
+                score = score_records(records, config)
+
+                if score > best_score:
+                    best_score = score
+                    best_records = records
+                    winning_method = strategy.upper()
+
+                if len(records) > 0 and score >= (len(records) * 10):
+                    logger.info(
+                        f"[{schedule_id}] Early termination triggered: {strategy.upper()} "
+                        f"achieved a penalty-free extraction."
+                    )
+                    break
+
+                del records
 
         if not best_records:
             logger.warning(f"[{schedule_id}] No text could be extracted at all. Saving empty array.")
@@ -137,14 +153,60 @@ def process_and_evaluate(pdf_path: Path, output_dir: Path, agency_mapping: dict,
     except Exception as e:
         logger.error(f"Failed to process {pdf_path.name}: {e}", exc_info=True)
 
-def run_state_pipeline(args, state_config: StateScheduleConfig, output_schema: dict, glob_pattern: str = "*.pdf", worker_func=None):
-    """Standardized entry point for state processing."""
+def _output_is_current(src_path: Path, output_dir: Path, dependencies=()) -> bool:
+    """True if the source's <stem>.json exists and was written after the source and every
+    existing dependency (schema, agency tables, sidecar files) last changed."""
+    out_path = output_dir / f"{src_path.stem}.json"
+    try:
+        out_mtime = out_path.stat().st_mtime
+        newest_input = src_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    for dep in dependencies:
+        try:
+            newest_input = max(newest_input, dep.stat().st_mtime)
+        except FileNotFoundError:
+            continue
+    return out_mtime >= newest_input
+
+def run_state_pipeline(
+    args, state_config: StateScheduleConfig, output_schema: dict, glob_pattern: str = "*.pdf",
+    worker_func=None, chunksize: int = 1, dependencies=(), sidecar_suffixes=()
+):
+    """Standardized entry point for state processing.
+
+    Files are dispatched largest-first so long-running schedules start early instead of
+    becoming the tail of the run. Keep chunksize at 1 for heavy per-file work (PDFs);
+    raise it for many small, cheap files (e.g. Ohio HTML) to cut per-task IPC.
+
+    For --skip-unchanged, `dependencies` lists extra shared inputs (lookup tables) and
+    `sidecar_suffixes` per-source companion files (e.g. '.json'); a change to either, the
+    schema or the agency CSV re-processes the file.
+    """
     agency_mapping = load_agency_mapping(args.state_code)
     
-    files = list(args.input_directory.glob(glob_pattern))
+    files = [p for p in args.input_directory.glob(glob_pattern) if p.is_file()]
     if not files:
         logger.warning(f"No files found in {args.input_directory} matching {glob_pattern}")
         return
+    if getattr(args, 'skip_unchanged', False):
+        # Every worker writes <stem>.json; an output newer than its source is already current
+        before = len(files)
+        shared_deps = [
+            p for p in (getattr(args, 'schema_path', None), _agency_csv_path(args.state_code), *dependencies)
+            if p is not None
+        ]
+        files = [
+            p for p in files
+            if not _output_is_current(
+                p, args.output_directory,
+                [*shared_deps, *(p.with_suffix(suffix) for suffix in sidecar_suffixes)]
+            )
+        ]
+        logger.info(f"Skipping {before - len(files)} unchanged files (--skip-unchanged).")
+        if not files:
+            return
+    files.sort(key=lambda p: p.stat().st_size, reverse=True)
         
     logger.info(f"Starting pipeline for {len(files)} files using {args.state_code.upper()} configuration.")
     
@@ -165,14 +227,24 @@ def run_state_pipeline(args, state_config: StateScheduleConfig, output_schema: d
     manager = multiprocessing.Manager()
     gpu_sem = manager.Semaphore(1) # Lock to 1 GPU instance
 
-    # Use 'spawn' for safe multiprocessing with complex libraries
-    ctx = multiprocessing.get_context('spawn')
-    # Use fewer processes than CPU count to be safe with memory
-    num_procs = max(1, multiprocessing.cpu_count() // 2)
+    # Never plain fork with these libraries. On POSIX a forkserver imports the parsing stack
+    # once and forks clean workers from it, so each (recycled) worker skips re-importing
+    # pdfplumber/pdfminer/bs4; Windows only has 'spawn'.
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context('forkserver')
+        ctx.set_forkserver_preload([__name__, worker_func.__module__])
+    else:
+        ctx = multiprocessing.get_context('spawn')
+    # Use fewer processes than CPU count to be safe with memory, and never more than there are files
+    num_procs = max(1, min(len(files), multiprocessing.cpu_count() // 2))
     with ctx.Pool(
         processes=num_procs, 
         maxtasksperchild=25,
         initializer=init_worker,
-        initargs=(gpu_sem,)
+        # The bound worker carries the agency mapping, schema and config; hand it over once
+        # per worker process instead of pickling it into every task
+        initargs=(gpu_sem, worker)
     ) as pool:
-        pool.map(worker, files)
+        # Results are written by the workers themselves; just drain in completion order
+        for _ in pool.imap_unordered(_run_worker, files, chunksize=chunksize):
+            pass
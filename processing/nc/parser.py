@@ -1,5 +1,5 @@
-import json
 import re
+import orjson
 import subprocess
 import logging
 from pathlib import Path
@@ -13,6 +13,11 @@ logger = logging.getLogger(__name__)
 
 from processing.nc.config import nc_config
 
+_RC_ID_RE = re.compile(r'^\d+\.[A-Z0-9]+$')
+_TRANSFER_INSTRUCTION_RE = re.compile(r'^(\d+\.[A-Z0-9]+)\s+(.+?):\s+(.+)$')
+_ITEM_NUMBER_RE = re.compile(r'^\d+$')
+_SEE_ALSO_RE = re.compile(r'(?i)\s+(SEE ALSO:.*)')
+
 def get_text(node):
     texts = []
     if isinstance(node, dict):
@@ -30,8 +35,7 @@ def get_paragraph_texts(node):
     paragraphs = []
     if isinstance(node, dict):
         if node.get('type') == 'P':
-            text = ''.join(get_text(node)).strip()
-            text = re.sub(r'\s+', ' ', text)
+            text = ' '.join(''.join(get_text(node)).split())
             if text:
                 paragraphs.append(text)
         if 'children' in node:
@@ -88,10 +92,10 @@ def parse_transfer_instructions(data) -> dict:
         if in_transfer:
             if text == 'Appendix' or text == 'Agency Series Title Item Number':
                 break
-            if re.match(r'^\d+\.[A-Z0-9]+$', text):
+            if _RC_ID_RE.match(text):
                 continue
             
-            match = re.match(r'^(\d+\.[A-Z0-9]+)\s+(.+?):\s+(.+)$', text)
+            match = _TRANSFER_INSTRUCTION_RE.match(text)
             if match:
                 rc_id = match.group(1)
                 instr = match.group(3)
@@ -109,8 +113,7 @@ def parse_appendix_mappings(trs) -> list[dict]:
     for tr in trs:
         cells = []
         for td in tr.get('children', []):
-            text = ''.join(get_text(td)).strip()
-            text = re.sub(r'\s+', ' ', text)
+            text = ' '.join(''.join(get_text(td)).split())
             if text: cells.append(text)
         
         if not cells: continue
@@ -129,7 +132,7 @@ def parse_appendix_mappings(trs) -> list[dict]:
                 item_number = cells[2]
                 appendix_records.append({'agency': current_agency, 'legacy_title': series_title, 'item_number': item_number})
             elif len(cells) == 2:
-                if re.match(r'^\d+$', cells[1]):
+                if _ITEM_NUMBER_RE.match(cells[1]):
                     series_title = cells[0]
                     item_number = cells[1]
                     appendix_records.append({'agency': current_agency, 'legacy_title': series_title, 'item_number': item_number})
@@ -143,10 +146,10 @@ def process_nc_pdf(pdf_path: Path, schema: dict) -> list[dict]:
     if not json_path.exists():
         return []
 
-    with open(json_path, 'r', encoding='utf-8') as f:
+    with open(json_path, 'rb') as f:
         try:
-            data = json.load(f)
-        except json.JSONDecodeError:
+            data = orjson.loads(f.read())
+        except orjson.JSONDecodeError:
             logger.error(f"Failed to parse JSON for {json_path.name}")
             return []
 
@@ -154,6 +157,7 @@ def process_nc_pdf(pdf_path: Path, schema: dict) -> list[dict]:
     trs = find_rows(data)
     appendix_mappings = parse_appendix_mappings(trs)
     
+    today = date.today().isoformat()
     records = []
     last_title = ''
     
@@ -163,8 +167,7 @@ def process_nc_pdf(pdf_path: Path, schema: dict) -> list[dict]:
     for tr in trs:
         cells = []
         for td in tr.get('children', []):
-            text = ''.join(get_text(td)).strip()
-            text = re.sub(r'\s+', ' ', text)
+            text = ' '.join(''.join(get_text(td)).split())
             cells.append(text)
         
         if not cells: continue
@@ -179,7 +182,7 @@ def process_nc_pdf(pdf_path: Path, schema: dict) -> list[dict]:
             
             # Extract "SEE ALSO" into description instead of dropping it entirely
             see_also = ""
-            see_also_match = re.search(r'(?i)\s+(SEE ALSO:.*)', raw_title)
+            see_also_match = _SEE_ALSO_RE.search(raw_title)
             if see_also_match:
                 see_also = see_also_match.group(1).strip()
                 clean_title = raw_title[:see_also_match.start()].strip()
@@ -221,7 +224,7 @@ def process_nc_pdf(pdf_path: Path, schema: dict) -> list[dict]:
                 legal_citation=cit,
                 comments=comments,
                 last_updated="2025-02-24",
-                last_checked=str(date.today()),
+                last_checked=today,
                 url="https://archives.ncdcr.gov/functional-schedule"
             )
             cleaned = clean_record_fields(raw_record, nc_config)
@@ -243,7 +246,7 @@ def process_nc_pdf(pdf_path: Path, schema: dict) -> list[dict]:
             legal_citation="",
             comments=f"Legacy Item Number mapped to Functional Schedule chapter {schedule_id}.",
             last_updated="2025-02-24",
-            last_checked=str(date.today()),
+            last_checked=today,
             url="https://www.ncdcr.gov/functional-schedule-state-agencies"
         )
         records.append(clean_record_fields(app_record, nc_config))
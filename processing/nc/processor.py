@@ -25,5 +25,7 @@ def run(args, output_schema: dict):
         nc_config, 
         output_schema, 
         glob_pattern="??_*.pdf", 
-        worker_func=nc_worker
+        worker_func=nc_worker,
+        # The pdfplumber structure JSON next to each PDF is what the parser actually reads
+        sidecar_suffixes=('.json',)
     )
@@ -6,13 +6,30 @@ import logging
 from pathlib import Path
 from bs4 import BeautifulSoup
 from email.utils import formatdate
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+def _write_atomic(file_path: Path, content: bytes) -> None:
+    """Writes to a temp file and renames it so an interrupted run never leaves a partial page."""
+    tmp_path = file_path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    tmp_path.replace(file_path)
+
+def _as_utf8(response: requests.Response) -> bytes:
+    """Page body re-encoded as UTF-8 (decoded as requests would for .text), so saved pages always parse as UTF-8."""
+    return response.text.encode('utf-8')
+
 def harvest_links(base_url: str) -> list[str]:
     """Scrapes the search result pages to find all individual schedule URLs."""
     schedule_links = []
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+    seen = set()
+
+    # One keep-alive session so the three 5000-row pages share a single TLS handshake
+    session = requests.Session()
+    session.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"})
 
     # Pages 1 to 3 at 5000 items per page covers the ~10,500 items
     for page in range(1, 4):
@@ -20,7 +37,7 @@ def harvest_links(base_url: str) -> list[str]:
         url = f"{base_url}/Schedule?Page={page}&PageSize=5000"
         
         try:
-            response = requests.get(url, headers=headers)
+            response = session.get(url, timeout=30)
             
             if response.status_code == 429:
                 logger.critical(f"Received 429 Too Many Requests. Exiting to prevent IP block.")
@@ -33,7 +50,8 @@ def harvest_links(base_url: str) -> list[str]:
                 href = link['href']
                 if '/Schedule/Details/' in href:
                     full_url = base_url + href
-                    if full_url not in schedule_links:
+                    if full_url not in seen:
+                        seen.add(full_url)
                         schedule_links.append(full_url)
             time.sleep(random.uniform(4.0, 6.0))
         except SystemExit:
@@ -79,8 +97,7 @@ def download_general_schedule(base_url: str, output_dir: Path) -> None:
 
             response.raise_for_status()
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(response.text)
+            _write_atomic(file_path, _as_utf8(response))
 
             logger.info(f"Downloaded general schedule: {filename}")
             time.sleep(random.uniform(4.0, 6.0))
@@ -94,9 +111,17 @@ def download_detail_pages(urls: list[str], output_dir: Path) -> None:
     """Downloads HTML files, utilizing If-Modified-Since to only fetch updated schedules."""
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Use a session for better connection pooling (more human-like)
+    # Use a session for better connection pooling (more human-like).
+    # Transient server errors are retried with backoff on the kept-alive connection.
+    # urllib3 would otherwise also retry a 429 that carries Retry-After, so that is switched
+    # off: a 429 must reach the hard stop below on the first response.
     session = requests.Session()
     session.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"})
+    retries = Retry(
+        total=5, backoff_factor=1.5, status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=False, raise_on_status=False
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retries))
 
     logger.info(f"Checking/Downloading {len(urls)} Ohio records...")
 
@@ -131,8 +156,7 @@ def download_detail_pages(urls: list[str], output_dir: Path) -> None:
 
             response.raise_for_status()
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(response.text)
+            _write_atomic(file_path, _as_utf8(response))
 
             if (i + 1) % 25 == 0 or i == 0:
                 logger.info(f"[{i+1}/{len(urls)}] Synced record {record_id}...")
@@ -2,6 +2,7 @@ import json
 import re
 import logging
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from bs4 import BeautifulSoup
 from word2number import w2n
@@ -20,27 +21,50 @@ logger = logging.getLogger(__name__)
 # Ohio General Schedule Constants & Regexes
 # ---------------------------------------------------------------------------
 
-_WHITESPACE_RE      = re.compile(r'\s+')
 _PERMANENT_RE       = re.compile(r'permanently?', re.IGNORECASE)
 _RETAIN_EMPTY_RE    = re.compile(r'^Retain[\s\.]*$', re.IGNORECASE)
 _THEN_DISP_RE       = re.compile(r'(?:,\s*)?then\s+(.*)', re.IGNORECASE)
 _OAKS_RE            = re.compile(r'\.?\s*OAKS:.*', re.IGNORECASE)
-_TRAILING_PUNCT_RE  = re.compile(r'[\.,;:]$')
-_DIGIT_YEAR_RE      = re.compile(r'\(?(\d+)\)?\s*year', re.IGNORECASE)
-_WORD_NUM_RE        = re.compile(r'\b([a-zA-Z]+(?:-[a-zA-Z]+)?)\b\s*year', re.IGNORECASE)
-_LEGAL_CITATION_RE  = re.compile(r'(\bORC\s*\d+\.\d+|\b\d+\s*CFR\s*\d+|\b\d+\s*USC\s*\d+)', re.IGNORECASE)
+_TRAILING_PUNCT     = ('.', ',', ';', ':')
+# Digit and spelled-out counts in one alternation, so the retention text is scanned once
+_YEAR_COUNT_RE      = re.compile(r'(?:\(?(?P<digit>\d+)\)?|\b(?P<word>[a-zA-Z]+(?:-[a-zA-Z]+)?)\b)\s*year', re.IGNORECASE)
+_LEGAL_CITATION_RE  = ohio_config.legal_citation_pattern
+# Detail-page labels, searched anywhere in the <b> text (so 'Responsible Agency:' still fills 'agency')
+_DETAIL_LABEL_RES   = {
+    "authorization number": re.compile(r"Authorization Number\s*:", re.IGNORECASE),
+    "agency": re.compile(r"Agency\s*:", re.IGNORECASE),
+    "agency series no": re.compile(r"Agency Series No\.?\s*:", re.IGNORECASE),
+    "record title": re.compile(r"Record Title\s*:", re.IGNORECASE),
+    "record description": re.compile(r"Record Description\s*:", re.IGNORECASE),
+}
 
 # ---------------------------------------------------------------------------
 # Ohio General Schedule Helpers
 # ---------------------------------------------------------------------------
 def _normalize(s: str) -> str:
-    return _WHITESPACE_RE.sub(' ', s).strip()
+    return ' '.join(s.split())
 
 def _cap_first(s: str) -> str:
     return s[0].upper() + s[1:] if s else ""
 
 def _clean_punct(s: str) -> str:
-    return _TRAILING_PUNCT_RE.sub('', s).strip()
+    # Drops exactly one trailing mark, as the old r'[\.,;:]$' sub did (rstrip would drop a run)
+    return (s[:-1] if s.endswith(_TRAILING_PUNCT) else s).strip()
+
+def _extract_retention_years(retention: str) -> int | None:
+    """A digit count anywhere wins over a spelled-out one; otherwise the first word count is used."""
+    word = None
+    for m in _YEAR_COUNT_RE.finditer(retention):
+        if m.group('digit'):
+            return int(m.group('digit'))
+        if word is None:
+            word = m.group('word')
+    if word is None:
+        return None
+    try:
+        return w2n.word_to_num(word.lower())
+    except ValueError:
+        return None
 
 def clean_ohio_general_record(record: dict) -> dict:
     title       = _normalize(get_nested_val(record, 'series_title') or '')
@@ -78,23 +102,12 @@ def clean_ohio_general_record(record: dict) -> dict:
     m = _LEGAL_CITATION_RE.search(desc) or _LEGAL_CITATION_RE.search(retention)
     legal_citation = m.group(1).strip() if m else ""
 
-    if 'permanent' in retention.lower() or 'permanent' in disposition.lower():
+    disp_lower = disposition.lower()
+    if 'permanent' in retention.lower() or 'permanent' in disp_lower:
         retention_years = None
     else:
-        digit_m = _DIGIT_YEAR_RE.search(retention)
-        if digit_m:
-            retention_years = int(digit_m.group(1))
-        else:
-            word_m = _WORD_NUM_RE.search(retention)
-            if word_m:
-                try:
-                    retention_years = w2n.word_to_num(word_m.group(1).lower())
-                except ValueError:
-                    retention_years = None
-            else:
-                retention_years = None
+        retention_years = _extract_retention_years(retention)
 
-    disp_lower = disposition.lower()
     is_confidential = 'confidential' in disp_lower and 'non-confidential' not in disp_lower
 
     update_record(record, 
@@ -111,23 +124,38 @@ def clean_ohio_general_record(record: dict) -> dict:
 # ---------------------------------------------------------------------------
 # Parsers
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=4096)
+def _parse_history_timestamp(text: str) -> datetime | None:
+    """Approval timestamps repeat across schedules, so strptime results are cached (None if unparseable)."""
+    try:
+        return datetime.strptime(text, "%m/%d/%Y %I:%M:%S %p")
+    except ValueError:
+        return None
+
+def _load_soup(html_file: Path) -> BeautifulSoup:
+    """Parses a harvested page with html.parser, whose repair of malformed nesting the field lookups rely on."""
+    # The harvester saves pages as UTF-8; decode explicitly rather than letting bs4 guess the
+    # charset, and replace stray bytes so one bad page can't raise out of the worker
+    return BeautifulSoup(html_file.read_text(encoding='utf-8', errors='replace'), 'html.parser')
+
 def process_ohio_general_html(html_file: Path, schema: dict) -> list[dict]:
     """Parses Ohio General Schedules (table-based HTML) into a list of records."""
-    with open(html_file, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f, 'html.parser')
+    soup = _load_soup(html_file)
 
     table_body = soup.find('tbody')
     if not table_body:
         logger.error("Could not find a <tbody> in %s", html_file.name)
         return []
 
+    today = date.today().isoformat()
     schedules = []
     for row in table_body.find_all('tr'):
-        cols = row.find_all('td')
+        texts = [td.get_text(separator=' ', strip=True) for td in row.find_all('td')]
 
-        if len(cols) != 4:
-            logger.warning("Skipping row with %d column(s) in %s", len(cols), html_file.name)
+        if len(texts) != 4:
+            logger.warning("Skipping row with %d column(s) in %s", len(texts), html_file.name)
             continue
+        series_id, title, desc, retention = texts
 
         raw_record = make_record(
             schema,
@@ -135,42 +163,53 @@ def process_ohio_general_html(html_file: Path, schema: dict) -> list[dict]:
             agency_name="",
             schedule_type="general",
             schedule_id="General",
-            series_id=cols[0].get_text(separator=' ', strip=True),
-            series_title=cols[1].get_text(separator=' ', strip=True),
-            series_description=cols[2].get_text(separator=' ', strip=True),
-            retention_statement=cols[3].get_text(separator=' ', strip=True),
+            series_id=series_id,
+            series_title=title,
+            series_description=desc,
+            retention_statement=retention,
             disposition="",
             last_updated=None,
-            last_checked=str(date.today()),
+            last_checked=today,
             url="https://rims.das.ohio.gov/GeneralSchedule"
         )
         schedules.append(clean_ohio_general_record(raw_record))
 
     return schedules
 
-def extract_field_text(soup: BeautifulSoup, label_pattern: str) -> str:
+def extract_labeled_fields(soup: BeautifulSoup, label_res: dict = _DETAIL_LABEL_RES) -> dict[str, str]:
+    """Maps each '<b>Label:</b> value' on a detail page to its value in one pass over the <b> tags.
+
+    Each key's pattern is searched anywhere in the <b> text, case-insensitively, and the first
+    matching tag in document order wins. Keys with no matching label are absent.
+    """
+    fields = {}
+    pending = dict(label_res)
     for b_tag in soup.find_all('b'):
-        if re.search(label_pattern, b_tag.get_text(strip=True), re.IGNORECASE):
-            parent = b_tag.parent
-            if parent:
-                full_text = parent.get_text(strip=True)
-                return full_text.replace(b_tag.get_text(strip=True), '').strip()
-    return ""
+        if not pending:
+            break
+        b_text = b_tag.get_text(strip=True)
+        parent = b_tag.parent
+        if not parent:
+            continue
+        for key, label_re in list(pending.items()):
+            if label_re.search(b_text):
+                fields[key] = parent.get_text(strip=True).replace(b_text, '').strip()
+                del pending[key]
+    return fields
 
 def process_ohio_html(html_file: Path, schema: dict) -> dict | None:
     """Parses Ohio Specific Agency Schedules (detail page DOM) into a standardized record."""
     record_id = html_file.stem.replace("spec_", "")
     source_url = f"https://rims.das.ohio.gov/Schedule/Details/{record_id}"
 
-    with open(html_file, 'r', encoding='utf-8') as f:
-        soup = BeautifulSoup(f, 'html.parser')
-        
     try:
-        auth_number = extract_field_text(soup, r"Authorization Number\s*:")
-        agency_code = extract_field_text(soup, r"Agency\s*:")
-        series_no = extract_field_text(soup, r"Agency Series No\.?\s*:")
-        title = extract_field_text(soup, r"Record Title\s*:")
-        desc = extract_field_text(soup, r"Record Description\s*:")
+        soup = _load_soup(html_file)
+        fields = extract_labeled_fields(soup)
+        auth_number = fields.get("authorization number", "")
+        agency_code = fields.get("agency", "")
+        series_no = fields.get("agency series no", "")
+        title = fields.get("record title", "")
+        desc = fields.get("record description", "")
         
         series_id = series_no if series_no else auth_number
         
@@ -179,12 +218,16 @@ def process_ohio_html(html_file: Path, schema: dict) -> dict | None:
         tables = soup.find_all('table')
         
         for table in tables:
-            headers = [th.get_text(strip=True).lower() for th in table.find_all('th')]
-            
-            if 'retention period' in headers:
-                tbody = table.find('tbody')
-                rows = tbody.find_all('tr') if tbody else table.find_all('tr')
-                
+            headers = {th.get_text(strip=True).lower() for th in table.find_all('th')}
+            is_retention = 'retention period' in headers
+            is_history = not is_retention and 'date' in headers and 'status' in headers
+            if not (is_retention or is_history):
+                continue
+
+            tbody = table.find('tbody')
+            rows = tbody.find_all('tr') if tbody else table.find_all('tr')
+
+            if is_retention:
                 for row in rows:
                     cols = row.find_all('td')
                     if len(cols) >= 4:
@@ -192,18 +235,18 @@ def process_ohio_html(html_file: Path, schema: dict) -> dict | None:
                         media = cols[2].get_text(strip=True)
                         disp_text = cols[3].get_text(strip=True)
 
-                        disp_match = re.search(r'(?i)(?:,\s*)?then\s+(.*)', ret_text)
+                        disp_match = _THEN_DISP_RE.search(ret_text)
                         if disp_match:
                             extracted_disp = disp_match.group(1).strip()
-                            oaks_match = re.search(r'(?i)(\.?\s*OAKS:.*)', extracted_disp)
+                            oaks_match = _OAKS_RE.search(extracted_disp)
                             if oaks_match:
-                                oaks_text = oaks_match.group(1)
+                                oaks_text = oaks_match.group(0)
                                 extracted_disp = extracted_disp.replace(oaks_text, '').strip()
                                 ret_text = ret_text.replace(disp_match.group(0), oaks_text).strip()
                             else:
                                 ret_text = ret_text.replace(disp_match.group(0), "").strip()
                             
-                            extracted_disp = re.sub(r'[\.,;:]$', '', extracted_disp).strip()
+                            extracted_disp = _clean_punct(extracted_disp)
                             if not disp_text or disp_text.lower() == 'none':
                                 disp_text = extracted_disp.title()
                         
@@ -211,18 +254,14 @@ def process_ohio_html(html_file: Path, schema: dict) -> dict | None:
                         if ret_text: retention_statements.append(f"{prefix}{ret_text}")
                         if disp_text and disp_text.lower() != 'none': dispositions.append(f"{prefix}{disp_text.title()}")
             
-            if 'date' in headers and 'status' in headers:
+            else:
                 dates = []
-                tbody = table.find('tbody')
-                rows = tbody.find_all('tr') if tbody else table.find_all('tr')
-                
                 for row in rows:
                     cols = row.find_all('td')
                     if len(cols) >= 4:
-                        try:
-                            dates.append(datetime.strptime(cols[3].get_text(strip=True), "%m/%d/%Y %I:%M:%S %p"))
-                        except ValueError:
-                            pass
+                        parsed = _parse_history_timestamp(cols[3].get_text(strip=True))
+                        if parsed:
+                            dates.append(parsed)
                 if dates:
                     latest_date_str = max(dates).strftime('%Y-%m-%d')
 
@@ -68,5 +68,6 @@ def run(args, output_schema: dict):
             ohio_config, 
             output_schema, 
             glob_pattern="*.html", 
-            worker_func=oh_worker
+            worker_func=oh_worker,
+            chunksize=32
         )
@@ -3,30 +3,52 @@ import re
 import logging
 import subprocess
 import contextlib
+from bisect import bisect_right
 from pathlib import Path
+from dataclasses import dataclass, field
 from datetime import date
 import pdfplumber
 from bs4 import BeautifulSoup
 
 from processing.base_config import StateScheduleConfig
-from processing.core import stringify_words, split_title_and_description
+from processing.core import stringify_words, split_title_and_description, word_reading_order, iter_pages_closing
 from processing.central_file import make_record, get_nested_val, set_nested_val, clean_record_fields
 
 logger = logging.getLogger(__name__)
 
+_PAGE_OF_PATTERN = r'^(?:page\s*)?\d+\s+of\s+\d+$'
+# Table column types, in header-matching priority order
+_COL_KEYS = ('desc', 'id', 'ret', 'disp')
+
+@dataclass(slots=True)
+class _Band:
+    """One series row in the vertical silo: the y-range under an anchor and its words per column."""
+    series_id: str
+    y_start: float
+    y_end: float
+    desc_words: list = field(default_factory=list)
+    ret_words: list = field(default_factory=list)
+    disp_words: list = field(default_factory=list)
+
+def _open_plumber(pdf_path: Path, pdf=None):
+    """Reuses a pdfplumber document the caller already opened, or opens (and later closes) one."""
+    return contextlib.nullcontext(pdf) if pdf is not None else pdfplumber.open(pdf_path)
+
 def parse_using_table_engine(
     pdf_path: Path, schedule_id: str, effective_date: str | None,
-    schema: dict, config: StateScheduleConfig
+    schema: dict, config: StateScheduleConfig, pdf=None
 ) -> list[dict]:
     processed_records = []
     schedule_type = "general" if schedule_id.startswith("GS") else "specific"
+    today = date.today().isoformat()
 
-    def match_header(cell_text: str, keyword_list: list[str]) -> bool:
-        text_upper = cell_text.upper()
-        return any(kw in text_upper for kw in keyword_list)
+    col_keywords = [(key, config.header_keywords.get(key, [])) for key in _COL_KEYS]
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
+    # Multi-page schedules repeat the same header row on every page; map each distinct one once
+    col_idx_cache: dict[tuple[str, ...], dict[str, int]] = {}
+
+    with _open_plumber(pdf_path, pdf) as pdf:
+        for page in iter_pages_closing(pdf):
             tables = page.extract_tables()
             for table in tables:
                 if not table or len(table) < 2:
@@ -51,19 +73,28 @@ def parse_using_table_engine(
                     ]
                     rows = table
 
-                col_idx = {'desc': 0, 'id': 1, 'ret': 2, 'disp': 3}
-                for i, h in enumerate(headers):
-                    if match_header(h, config.header_keywords.get('desc', [])): col_idx['desc'] = i
-                    elif match_header(h, config.header_keywords.get('id', [])): col_idx['id'] = i
-                    elif match_header(h, config.header_keywords.get('ret', [])): col_idx['ret'] = i
-                    elif match_header(h, config.header_keywords.get('disp', [])): col_idx['disp'] = i
+                header_key = tuple(headers)
+                col_idx = col_idx_cache.get(header_key)
+                if col_idx is None:
+                    col_idx = {'desc': 0, 'id': 1, 'ret': 2, 'disp': 3}
+                    for i, h in enumerate(headers):
+                        h_upper = h.upper()
+                        # First matching column type wins, in _COL_KEYS order
+                        for key, kw_list in col_keywords:
+                            if any(kw in h_upper for kw in kw_list):
+                                col_idx[key] = i
+                                break
+                    col_idx_cache[header_key] = col_idx
+
+                # Rows shorter than this cannot hold both the series number and description cells
+                min_row_len = max(col_idx['id'], col_idx['desc']) + 1
 
                 for row in rows:
-                    clean_row = [str(cell) if cell else "" for cell in row]
-                    
-                    if len(clean_row) <= col_idx['id']:
+                    if len(row) < min_row_len:
                         continue
 
+                    clean_row = [str(cell) if cell else "" for cell in row]
+
                     series_number = clean_row[col_idx['id']].replace('\n', '').strip()
                     if not config.series_id_pattern.match(series_number):
                         continue
@@ -102,7 +133,7 @@ def parse_using_table_engine(
                         retention_statement=retention_statement,
                         disposition=raw_disposition,
                         last_updated=effective_date,
-                        last_checked=str(date.today())
+                        last_checked=today
                     )
                     processed_records.append(clean_record_fields(raw_record, config))
 
@@ -110,16 +141,43 @@ def parse_using_table_engine(
     
 def parse_using_vertical_silo(
     pdf_path: Path, schedule_id: str, effective_date: str | None,
-    schema: dict, config: StateScheduleConfig
+    schema: dict, config: StateScheduleConfig, pdf=None
 ) -> list[dict]:
-    all_records = []
+    processed_records = []
     current_record = None
     g1, g2, g3 = config.default_walls
-    footer_strings = config.footer_strings
+    # Page numbers and the state's footer strings share one alternation, so each word
+    # costs a single regex scan instead of one test per noise string
+    noise_re = re.compile('|'.join([_PAGE_OF_PATTERN, *map(re.escape, config.footer_strings)]))
     schedule_type = "general" if schedule_id.startswith("GS") else "specific"
+    today = date.today().isoformat()
+
+    def finalize(rec: _Band) -> dict:
+        # A band is closed once a later anchor supersedes it, so its word lists can be
+        # stringified and dropped right away instead of held until the end of the PDF.
+        raw_desc = stringify_words(rec.desc_words)
+        retention = stringify_words(rec.ret_words)
+        disposition = stringify_words(rec.disp_words)
+
+        series_title, series_description = split_title_and_description(raw_desc)
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
+        raw_record = make_record(
+            schema,
+            state=config.state_code,
+            schedule_type=schedule_type,
+            schedule_id=schedule_id,
+            series_id=rec.series_id,
+            series_title=series_title,
+            series_description=series_description,
+            retention_statement=retention,
+            disposition=disposition,
+            last_updated=effective_date,
+            last_checked=today
+        )
+        return clean_record_fields(raw_record, config)
+
+    with _open_plumber(pdf_path, pdf) as pdf:
+        for page in iter_pages_closing(pdf):
             words = page.extract_words(keep_blank_chars=False)
             if not words:
                 continue
@@ -146,16 +204,16 @@ def parse_using_vertical_silo(
             if page_g2: g2 = page_g2
             if page_g3: g3 = page_g3
 
-            valid_words = []
-            for w in words:
-                text_lower = w['text'].lower()
-                if w['top'] < header_bottom + 5 or w['top'] < 50 or w['bottom'] > page.height - 40:
-                    continue
-                if re.match(r'^(page\s*)?\d+\s+of\s+\d+$', text_lower):
-                    continue
-                if any(fs in text_lower for fs in footer_strings):
-                    continue
-                valid_words.append(w)
+            min_top = max(header_bottom + 5, 50)
+            max_bottom = page.height - 40
+            valid_words = [
+                w for w in words
+                if min_top <= w['top'] and w['bottom'] <= max_bottom
+                and not noise_re.search(w['text'].lower())
+            ]
+
+            # Sort the page once; band lists then receive words already in reading order
+            valid_words.sort(key=word_reading_order)
 
             anchors = [
                 w for w in valid_words
@@ -166,74 +224,49 @@ def parse_using_vertical_silo(
             if not anchors:
                 if current_record:
                     for w in valid_words:
-                        if w['x0'] < g1: current_record['desc_words'].append(w)
-                        elif w['x0'] >= g3: current_record['disp_words'].append(w)
-                        else: current_record['ret_words'].append(w)
+                        if w['x0'] < g1: current_record.desc_words.append(w)
+                        elif w['x0'] >= g3: current_record.disp_words.append(w)
+                        else: current_record.ret_words.append(w)
                 continue
 
-            bands = []
-            for i, anchor in enumerate(anchors):
-                y_start = anchor['top'] - 15
-                y_end = anchors[i + 1]['top'] - 15 if i + 1 < len(anchors) else page.height
-                bands.append({
-                    'series_id': anchor['text'].strip(),
-                    'y_start': y_start,
-                    'y_end': y_end,
-                    'desc_words': [],
-                    'ret_words': [],
-                    'disp_words': []
-                })
+            # Each band runs from just above its anchor to just above the next one
+            band_ends = [a['top'] - 15 for a in anchors[1:]] + [page.height]
+            bands = [
+                _Band(anchor['text'].strip(), anchor['top'] - 15, y_end)
+                for anchor, y_end in zip(anchors, band_ends)
+            ]
+
+            # Bands are built from top-sorted anchors, so they are contiguous and ordered by
+            # y_start; a binary search finds the owning band instead of scanning every band.
+            band_starts = [band.y_start for band in bands]
+            # Identity, not dict equality: `w in anchors` compared every key of every anchor
+            anchor_ids = {id(a) for a in anchors}
 
             for w in valid_words:
-                if w in anchors: continue
-                assigned = False
-                for band in bands:
-                    if band['y_start'] <= w['top'] < band['y_end']:
-                        if w['x0'] < g1: 
-                            band['desc_words'].append(w)
-                        elif w['x0'] >= g3: 
-                            band['disp_words'].append(w)
-                        else:
-                            band['ret_words'].append(w)
-                        assigned = True
-                        break
-                if not assigned and current_record and w['top'] < bands[0]['y_start']:
+                if id(w) in anchor_ids: continue
+                idx = bisect_right(band_starts, w['top']) - 1
+                if idx >= 0 and w['top'] < bands[idx].y_end:
+                    band = bands[idx]
                     if w['x0'] < g1: 
-                        current_record['desc_words'].append(w)
+                        band.desc_words.append(w)
                     elif w['x0'] >= g3: 
-                        current_record['disp_words'].append(w)
+                        band.disp_words.append(w)
                     else:
-                        current_record['ret_words'].append(w)
+                        band.ret_words.append(w)
+                elif current_record and w['top'] < bands[0].y_start:
+                    if w['x0'] < g1: 
+                        current_record.desc_words.append(w)
+                    elif w['x0'] >= g3: 
+                        current_record.disp_words.append(w)
+                    else:
+                        current_record.ret_words.append(w)
 
             for band in bands:
-                if current_record: all_records.append(current_record)
+                if current_record: processed_records.append(finalize(current_record))
                 current_record = band
 
     if current_record:
-        all_records.append(current_record)
-
-    processed_records = []
-    for rec in all_records:
-        raw_desc = stringify_words(rec['desc_words'])
-        retention = stringify_words(rec['ret_words'])
-        disposition = stringify_words(rec['disp_words'])
-
-        series_title, series_description = split_title_and_description(raw_desc)
-
-        raw_record = make_record(
-            schema,
-            state=config.state_code,
-            schedule_type=schedule_type,
-            schedule_id=schedule_id,
-            series_id=rec['series_id'],
-            series_title=series_title,
-            series_description=series_description,
-            retention_statement=retention,
-            disposition=disposition,
-            last_updated=effective_date,
-            last_checked=str(date.today())
-        )
-        processed_records.append(clean_record_fields(raw_record, config))
+        processed_records.append(finalize(current_record))
 
     return processed_records
 
@@ -243,6 +276,7 @@ def parse_using_marker_html(
 ) -> list[dict]:
     processed_records = []
     schedule_type = "general" if schedule_id.startswith("GS") else "specific"
+    today = date.today().isoformat()
 
     soup = BeautifulSoup(html_content, 'html.parser')
     tables = soup.find_all('table')
@@ -278,7 +312,7 @@ def parse_using_marker_html(
                         retention_statement=col3,
                         disposition="",
                         last_updated=effective_date,
-                        last_checked=str(date.today())
+                        last_checked=today
                     )
 
                 elif current_record and not col2 and not col3:
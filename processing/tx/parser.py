@@ -7,16 +7,30 @@ import re
 import csv
 import logging
 import pdfplumber
+from bisect import bisect_right
 from pathlib import Path
 from datetime import datetime, date
 from bs4 import BeautifulSoup
 
 from processing.tx.config import texas_config
 from processing.central_file import make_record, clean_record_fields, update_record, get_nested_val
-from processing.core import stringify_words, split_title_and_description
+from processing.core import stringify_words, split_title_and_description, iter_pages_closing
 
 logger = logging.getLogger(__name__)
 
+_AGENCY_CELL_RE = re.compile(r'(.+?)\((\d{3,4})\)')
+_RECERT_MONTH_RE = re.compile(r'\d{4}-\d{2}')
+_PDF_FILENAME_RE = re.compile(r'^(\d{3,4})\.pdf$')
+_SLASH_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_AGENCY_CODE_RE = re.compile(r'Agency\s+Code[:\s]+(\d{3,4})', re.IGNORECASE)
+_AGENCY_NAME_RE = re.compile(r'Agency\s+Name[:\s]+(.+?)(?:\n|$)', re.IGNORECASE)
+_RETENTION_CODE_RE = re.compile(r'^([A-Z]{2,3})\b')
+_RETENTION_UNIT_RES = [
+    (unit, re.compile(fr'(\d+(?:\.\d+)?)\s*(?:{unit})', re.IGNORECASE))
+    for unit in ['year', 'month', 'week', 'day']
+]
+_PLUS_NUMBER_RE = re.compile(r'\+\s*(\d+(?:\.\d+)?)')
+
 # ---------------------------------------------------------------------------
 # HTML Agency Index Parser
 # ---------------------------------------------------------------------------
@@ -43,7 +57,7 @@ def parse_agencies_html(html_path: Path) -> dict:
                 continue
 
             agency_cell = cells[0].get_text(strip=True)
-            match = re.match(r'(.+?)\((\d{3,4})\)', agency_cell)
+            match = _AGENCY_CELL_RE.match(agency_cell)
             if match:
                 agency_name = match.group(1).strip()
                 schedule_id = match.group(2)
@@ -58,7 +72,7 @@ def parse_agencies_html(html_path: Path) -> dict:
                         last_updated = date_obj.strftime('%Y-%m-%d')
                     except: pass
 
-                next_update = next_recert if re.match(r'\d{4}-\d{2}', next_recert) else ''
+                next_update = next_recert if _RECERT_MONTH_RE.match(next_recert) else ''
 
                 agencies[schedule_id] = {
                     'name': agency_name,
@@ -103,7 +117,7 @@ def extract_metadata_from_pdf(pdf_path: Path) -> dict:
         'url': ''
     }
 
-    filename_match = re.match(r'^(\d{3,4})\.pdf$', pdf_path.name)
+    filename_match = _PDF_FILENAME_RE.match(pdf_path.name)
     if filename_match:
         metadata['schedule_id'] = filename_match.group(1)
 
@@ -114,7 +128,7 @@ def extract_metadata_from_pdf(pdf_path: Path) -> dict:
                 if not text: continue
 
                 if not metadata['last_updated']:
-                    date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', text)
+                    date_match = _SLASH_DATE_RE.search(text)
                     if date_match:
                         try:
                             date_obj = datetime.strptime(date_match.group(1), '%m/%d/%Y')
@@ -122,11 +136,11 @@ def extract_metadata_from_pdf(pdf_path: Path) -> dict:
                         except: pass
 
                 if not metadata['schedule_id']:
-                    code_match = re.search(r'Agency\s+Code[:\s]+(\d{3,4})', text, re.IGNORECASE)
+                    code_match = _AGENCY_CODE_RE.search(text)
                     if code_match: metadata['schedule_id'] = code_match.group(1)
 
                 if not metadata['agency_name']:
-                    name_match = re.search(r'Agency\s+Name[:\s]+(.+?)(?:\n|$)', text, re.IGNORECASE)
+                    name_match = _AGENCY_NAME_RE.search(text)
                     if name_match: metadata['agency_name'] = name_match.group(1).strip()
     except Exception as e:
         logger.error(f"Error extracting metadata from {pdf_path}: {e}")
@@ -149,15 +163,15 @@ def parse_retention_field(retention_text: str, retention_codes: dict) -> dict:
     if not retention_text: return result
 
     retention_text = retention_text.strip()
-    code_match = re.match(r'^([A-Z]{2,3})\b', retention_text)
+    code_match = _RETENTION_CODE_RE.match(retention_text)
     if code_match: result['retention_code'] = code_match.group(1)
         
-    for unit in ['year', 'month', 'week', 'day']:
-        m = re.search(fr'(\d+(?:\.\d+)?)\s*(?:{unit})', retention_text, re.IGNORECASE)
+    for unit, unit_re in _RETENTION_UNIT_RES:
+        m = unit_re.search(retention_text)
         if m: result[f'retention_{unit}s'] = m.group(1)
     
     if not any([result['retention_years'], result['retention_months'], result['retention_weeks'], result['retention_days']]):
-        num_match = re.search(r'\+\s*(\d+(?:\.\d+)?)', retention_text)
+        num_match = _PLUS_NUMBER_RE.search(retention_text)
         if num_match: result['retention_years'] = num_match.group(1)
 
     parts = []
@@ -185,9 +199,10 @@ def parse_using_vertical_silo_tx(
     # g4: end of Retention Code column (~530)
     # g5: end of Retention Period columns (~700)
     g1, g2, g3, g4, g5 = config.default_walls
+    today = date.today().isoformat()
     
     with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
+        for page in iter_pages_closing(pdf):
             words = page.extract_words()
             if not words: continue
 
@@ -200,13 +215,11 @@ def parse_using_vertical_silo_tx(
 
             if not anchors: continue
 
-            bands = []
-            for i, anchor in enumerate(anchors):
-                y_start = anchor['top'] - 5
-                y_end = anchors[i + 1]['top'] - 5 if i + 1 < len(anchors) else page.height
-                bands.append({
+            band_ends = [a['top'] - 5 for a in anchors[1:]] + [page.height]
+            bands = [
+                {
                     'rsin': anchor['text'].strip(),
-                    'y_start': y_start,
+                    'y_start': anchor['top'] - 5,
                     'y_end': y_end,
                     'ain_words': [],
                     'title_words': [],
@@ -214,19 +227,25 @@ def parse_using_vertical_silo_tx(
                     'ret_code_words': [],
                     'ret_period_words': [],
                     'remarks_words': []
-                })
+                }
+                for anchor, y_end in zip(anchors, band_ends)
+            ]
+
+            # Bands come from top-sorted anchors and are contiguous, so bisect finds the owner
+            band_starts = [band['y_start'] for band in bands]
 
             for w in valid_words:
-                for band in bands:
-                    if band['y_start'] <= w['top'] < band['y_end']:
-                        if w['x0'] < 50: band['ain_words'].append(w)
-                        elif 50 <= w['x0'] < g1: pass # It's the anchor
-                        elif g1 <= w['x0'] < g2: band['title_words'].append(w)
-                        elif g2 <= w['x0'] < g3: band['desc_words'].append(w)
-                        elif g3 <= w['x0'] < g4: band['ret_code_words'].append(w)
-                        elif g4 <= w['x0'] < g5: band['ret_period_words'].append(w)
-                        else: band['remarks_words'].append(w)
-                        break
+                idx = bisect_right(band_starts, w['top']) - 1
+                if idx < 0 or w['top'] >= bands[idx]['y_end']:
+                    continue
+                band = bands[idx]
+                if w['x0'] < 50: band['ain_words'].append(w)
+                elif 50 <= w['x0'] < g1: pass # It's the anchor
+                elif g1 <= w['x0'] < g2: band['title_words'].append(w)
+                elif g2 <= w['x0'] < g3: band['desc_words'].append(w)
+                elif g3 <= w['x0'] < g4: band['ret_code_words'].append(w)
+                elif g4 <= w['x0'] < g5: band['ret_period_words'].append(w)
+                else: band['remarks_words'].append(w)
 
             for band in bands:
                 ain = stringify_words(band['ain_words'])
@@ -248,7 +267,7 @@ def parse_using_vertical_silo_tx(
                     rsin=rsin,
                     comments=remarks,
                     last_updated=effective_date,
-                    last_checked=str(date.today())
+                    last_checked=today
                 )
                 
                 # Parse retention
@@ -276,7 +295,7 @@ def process_texas_pdf(pdf_path: Path, schema: dict, retention_codes_path: Path,
 
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
+            for page in iter_pages_closing(pdf):
                 tables = page.extract_tables()
                 if not tables: continue
 
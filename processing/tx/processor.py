@@ -6,11 +6,13 @@ from processing.extractor_engine import run_state_pipeline
 
 logger = logging.getLogger(__name__)
 
+RETENTION_CODES_PATH = Path("processing/tx/resources/retentioncodes.csv")
+AGENCIES_HTML_PATH = Path("processing/tx/src/agencies.html")
+
 def tx_worker(pdf_path: Path, output_dir: Path, agency_mapping: dict, schema: dict, config, skip_ocr: bool):
     """Worker wrapper for Texas retention schedules."""
-    retention_codes_path = Path("processing/tx/resources/retentioncodes.csv")
     try:
-        records = process_texas_pdf(pdf_path, schema, retention_codes_path, agency_mapping)
+        records = process_texas_pdf(pdf_path, schema, RETENTION_CODES_PATH, agency_mapping)
         if records:
             # Texas typically groups by schedule_id, but per-file is equivalent here
             save_records(records, output_dir, default_filename=f"{pdf_path.stem}.json")
@@ -23,16 +25,16 @@ def run(args, output_schema: dict):
     from processing.tx.config import texas_config
     
     # Pre-load agency mapping for the workers
-    agencies_html_path = Path("processing/tx/src/agencies.html")
     agency_mapping = {}
-    if agencies_html_path.exists():
-        agency_mapping = parse_agencies_html(agencies_html_path)
-        logger.info(f"Loaded {len(agency_mapping)} agencies from {agencies_html_path}")
+    if AGENCIES_HTML_PATH.exists():
+        agency_mapping = parse_agencies_html(AGENCIES_HTML_PATH)
+        logger.info(f"Loaded {len(agency_mapping)} agencies from {AGENCIES_HTML_PATH}")
 
     # Standard runner will handle the glob and the pool
     run_state_pipeline(
         args, 
         texas_config, 
         output_schema, 
-        worker_func=tx_worker
+        worker_func=tx_worker,
+        dependencies=(AGENCIES_HTML_PATH, RETENTION_CODES_PATH)
     )
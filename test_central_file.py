@@ -0,0 +1,22 @@
+from copy import deepcopy
+from processing.central_file import _copy_schema, make_record, get_nested_val
+
+SCHEMA = {
+    "state": None,
+    "series_metadata": {"series_title": None, "tags": []},
+    "retention_rules": [{"code": None}],
+}
+
+def test_copy_schema_matches_deepcopy():
+    copy = _copy_schema(SCHEMA)
+    assert copy == deepcopy(SCHEMA)
+    # Every container is new, so filling one record never leaks into the template
+    assert copy["series_metadata"] is not SCHEMA["series_metadata"]
+    assert copy["series_metadata"]["tags"] is not SCHEMA["series_metadata"]["tags"]
+    assert copy["retention_rules"][0] is not SCHEMA["retention_rules"][0]
+
+def test_make_record_leaves_schema_untouched():
+    record = make_record(SCHEMA, state="va", series_title="Payroll")
+    assert get_nested_val(record, "series_title") == "Payroll"
+    assert SCHEMA["state"] is None
+    assert SCHEMA["series_metadata"]["series_title"] is None
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+from processing.core import iter_pages_closing, word_reading_order, stringify_words, split_title_and_description
+
+class _Page:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+def test_iter_pages_closing():
+    pages = [_Page(), _Page(), _Page()]
+    pdf = SimpleNamespace(pages=pages)
+
+    gen = iter_pages_closing(pdf)
+    first = next(gen)
+    assert not first.closed  # open while the caller is using it
+    second = next(gen)
+    assert first.closed and not second.closed
+
+    # Breaking out early still closes the page in hand
+    gen.close()
+    assert second.closed
+    assert not pages[2].closed
+
+def test_word_reading_order():
+    words = [
+        {'text': 'b', 'top': 101.0, 'x0': 50},
+        {'text': 'next', 'top': 120.0, 'x0': 10},
+        {'text': 'a', 'top': 99.0, 'x0': 10},  # same approximate line as 'b'
+    ]
+    assert word_reading_order(words[0]) == (100, 50)
+    assert [w['text'] for w in sorted(words, key=word_reading_order)] == ['a', 'b', 'next']
+    assert stringify_words(words) == "a b next"
+
+def test_stringify_words_joins_hyphenated_breaks():
+    words = [{'text': 'retent-', 'top': 10, 'x0': 0}, {'text': 'ion', 'top': 20, 'x0': 0}]
+    assert stringify_words(words) == "retention"
+
+def test_split_title_and_description():
+    # Trigger verbs, in any case, start the description
+    assert split_title_and_description("Payroll Records This series documents pay.") == (
+        "Payroll Records", "This series documents pay."
+    )
+    assert split_title_and_description("Minutes CONSISTS of board minutes") == ("Minutes", "CONSISTS of board minutes")
+    # No trigger verb: the keyword fast path skips the regex and splits on the first period
+    assert split_title_and_description("Case Files. Closed cases.") == ("Case Files", "Closed cases.")
+    # A keyword only as part of a longer word does not split
+    assert split_title_and_description("Consistsx Report") == ("Consistsx Report", "")
+    long_title = "x" * 120 + ". tail"
+    assert split_title_and_description(long_title) == (long_title, "")
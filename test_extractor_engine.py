@@ -0,0 +1,28 @@
+import os
+from processing.extractor_engine import _output_is_current
+
+def _touch(path, mtime):
+    path.write_text("x")
+    os.utime(path, (mtime, mtime))
+
+def test_output_is_current(tmp_path):
+    src = tmp_path / "101.pdf"
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    out = out_dir / "101.json"
+    dep = tmp_path / "agencies.html"
+
+    _touch(src, 1000)
+    assert not _output_is_current(src, out_dir)  # no output yet
+
+    _touch(out, 2000)
+    assert _output_is_current(src, out_dir)
+
+    _touch(src, 3000)
+    assert not _output_is_current(src, out_dir)  # source edited after the output
+
+    _touch(src, 1000)
+    _touch(dep, 3000)
+    assert not _output_is_current(src, out_dir, [dep])  # a tracked input changed
+    # Missing dependencies are ignored rather than forcing a re-run
+    assert _output_is_current(src, out_dir, [tmp_path / "missing.csv"])
@@ -0,0 +1,39 @@
+from bs4 import BeautifulSoup
+from processing.oh.parser import extract_labeled_fields, _extract_retention_years
+
+DETAIL_HTML = """
+<div><p><b>Authorization Number:</b> 12345</p></div>
+<div><p><b>Responsible Agency:</b> DAS</p></div>
+<div><p><b>Agency:</b> Ignored, a label above already matched</p></div>
+<div><p><b>Agency Series No.:</b> A-7</p></div>
+<div><p><b>Record Title :</b> Payroll Records</p></div>
+<div><p><b>Record Title:</b> Duplicate title</p></div>
+<div><p><b>Notes</b> no colon, never a field</p></div>
+"""
+
+def test_extract_labeled_fields():
+    fields = extract_labeled_fields(BeautifulSoup(DETAIL_HTML, 'html.parser'))
+
+    assert fields["authorization number"] == "12345"
+    # Labels are searched anywhere in the <b> text, and the first match in document order wins
+    assert fields["agency"] == "DAS"
+    # Trailing '.' before the colon, and whitespace before the colon
+    assert fields["agency series no"] == "A-7"
+    assert fields["record title"] == "Payroll Records"
+    # No label on the page: the key is absent, callers fall back to ""
+    assert "record description" not in fields
+
+def test_extract_retention_years():
+    assert _extract_retention_years("Retain 5 years") == 5
+    assert _extract_retention_years("Retain (3) years, then destroy") == 3
+    # A digit count anywhere wins over an earlier spelled-out one
+    assert _extract_retention_years("Retain two years or 7 years after audit") == 7
+    assert _extract_retention_years("Retain twenty-one years") == 21
+    # Not a number word, and no count at all
+    assert _extract_retention_years("Retain several years") is None
+    assert _extract_retention_years("Retain until superseded") is None
+
+if __name__ == "__main__":
+    test_extract_labeled_fields()
+    test_extract_retention_years()
+    print("ok")